@@ -20,6 +20,8 @@
 from __future__ import annotations
 from typing import *
 
+import functools
+
 from edb import errors
 
 from edb.common import context as ctx_utils
@@ -201,12 +203,15 @@ class InheritingObjectCommand(sd.ObjectCommand[so.InheritingObjectT]):
             ],
         ] = {}
 
-        ancestors = set(self.scls.get_ancestors(schema).objects(schema))
-        for base in bases.objects(schema) + (self.scls,):
+        scls = self.scls
+        ancestors = set(scls.get_ancestors(schema).objects(schema))
+        for base in bases.objects(schema) + (scls,):
+            is_self = base == scls
+            base_items = base.get_field_value(schema, attr).items(schema)
             base_refs: Dict[
                 sn.Name,
                 s_referencing.ReferencedInheritingObject,
-            ] = dict(base.get_field_value(schema, attr).items(schema))
+            ]
 
             # Pointers can reference each other if they are computed,
             # and if they are processed in the wrong order,
@@ -215,17 +220,19 @@ class InheritingObjectCommand(sd.ObjectCommand[so.InheritingObjectT]):
             # Since inherit_fields doesn't recompile expressions
             # in transient derivations, we skip the sorting there.
             if not context.transient_derivation:
-                rev_refs = {v: k for k, v in base_refs.items()}
+                rev_refs = {v: k for k, v in base_items}
                 base_refs = {
                     rev_refs[v]: v
                     for v in reversed(
-                        sd.sort_by_cross_refs(schema, base_refs.values()))
+                        sd.sort_by_cross_refs(schema, rev_refs.keys()))
                 }
+            else:
+                base_refs = dict(base_items)
 
             for k, v in base_refs.items():
                 if not v.should_propagate(schema):
                     continue
-                if base == self.scls and not v.get_owned(schema):
+                if is_self and not v.get_owned(schema):
                     continue
 
                 mcls = type(v)
@@ -246,7 +253,7 @@ class InheritingObjectCommand(sd.ObjectCommand[so.InheritingObjectT]):
                     refs[fqname] = (create_cmd, astnode, [])
 
                 objs = refs[fqname][2]
-                if base != self.scls:
+                if not is_self:
                     objs.append(v)
                 elif not objs:
                     # If we are looking at refs in the base object
@@ -259,12 +266,14 @@ class InheritingObjectCommand(sd.ObjectCommand[so.InheritingObjectT]):
                     # base graph looking for objects with referrers in
                     # our new ancestor set.
                     work = list(reversed(v.get_bases(schema).objects(schema)))
+                    seen: Set[so.Object] = set()
                     while work:
                         vbase = work.pop()
-                        subj = vbase.get_referrer(schema)
-                        if vbase in objs:
+                        if vbase in seen:
                             continue
-                        elif subj is None or subj in ancestors:
+                        seen.add(vbase)
+                        subj = vbase.get_referrer(schema)
+                        if subj is None or subj in ancestors:
                             objs.append(vbase)
                         else:
                             work.extend(
@@ -330,6 +339,8 @@ class InheritingObjectCommand(sd.ObjectCommand[so.InheritingObjectT]):
         self,
         schema: s_schema.Schema,
         context: sd.CommandContext,
+        *,
+        ancestors: Optional[List[so.InheritingObjectT]] = None,
     ) -> s_schema.Schema:
         from . import ordering
 
@@ -339,9 +350,12 @@ class InheritingObjectCommand(sd.ObjectCommand[so.InheritingObjectT]):
         orig_rec = context.current().enable_recursion
         context.current().enable_recursion = False
 
+        if ancestors is None:
+            ancestors = so.compute_ancestors(schema, scls)
+
         new_ancestors = so.ObjectList[so.InheritingObjectT].create(
             schema,
-            so.compute_ancestors(schema, scls),
+            ancestors,
         )
         self.set_attribute_value(
             'ancestors',
@@ -556,14 +570,28 @@ BaseDelta_T = Tuple[
 ]
 
 
+# Shells produced here carry nothing but a name and a class and are
+# never mutated, so identical ones can be shared between rebase commands
+# instead of being allocated anew for every base of every delta.
+@functools.lru_cache(maxsize=10240)
+def _get_base_shell(
+    name: sn.Name,
+    t: Type[so.InheritingObjectT],
+) -> so.ObjectShell[so.InheritingObjectT]:
+    return so.ObjectShell(name=name, schemaclass=t)
+
+
 def delta_bases(
     old_bases: Iterable[sn.Name],
     new_bases: Iterable[sn.Name],
     t: Type[so.InheritingObjectT],
 ) -> BaseDelta_T[so.InheritingObjectT]:
+    old_bases = tuple(old_bases)
+    new_bases = tuple(new_bases)
     dropped = frozenset(old_bases) - frozenset(new_bases)
-    removed_bases = [so.ObjectShell(name=b, schemaclass=t) for b in dropped]
+    removed_bases = [_get_base_shell(b, t) for b in dropped]
     common_bases = [b for b in old_bases if b not in dropped]
+    common_set = frozenset(common_bases)
 
     added_bases: List[BaseDeltaItem_T[so.InheritingObjectT]] = []
     j = 0
@@ -577,7 +605,7 @@ def delta_bases(
                 # Found common base, insert the accumulated
                 # list of new bases and continue
                 if added_base_refs:
-                    ref = so.ObjectShell(name=common_bases[j], schemaclass=t)
+                    ref = _get_base_shell(common_bases[j], t)
                     added_bases.append((added_base_refs, ('BEFORE', ref)))
                     added_base_refs = []
                 j += 1
@@ -587,13 +615,13 @@ def delta_bases(
                     continue
 
             # Base has been inserted at position j
-            added_base_refs.append(so.ObjectShell(name=base, schemaclass=t))
+            added_base_refs.append(_get_base_shell(base, t))
             added_set.add(base)
 
     # Finally, add all remaining bases to the end of the list
     tail_bases = added_base_refs + [
-        so.ObjectShell(name=b, schemaclass=t) for b in new_bases
-        if b not in added_set and b not in common_bases
+        _get_base_shell(b, t) for b in new_bases
+        if b not in added_set and b not in common_set
     ]
 
     if tail_bases:
@@ -689,7 +717,8 @@ class CreateInheritingObject(
         bases_coll = self.get_resolved_attribute_value(
             'bases', schema=schema, context=context)
         bases = () if bases_coll is None else bases_coll.objects(schema)
-        ancestors = so.compute_lineage(schema, bases, self.get_verbosename())
+        ancestors = so.compute_lineage(
+            schema, bases, lambda: self.get_verbosename())
         ancestors_coll = so.ObjectList[so.InheritingObjectT].create(
             schema, ancestors)
         self.set_attribute_value('ancestors', ancestors_coll.as_shell(schema))
@@ -887,11 +916,27 @@ class AlterInheritingObjectOrFragment(
                     bases,
                     fields=props,
                 )
-                if context.enable_recursion:
+                if (
+                    context.enable_recursion
+                    and self._needs_field_propagation(scls, props)
+                ):
                     self._propagate_field_alter(schema, context, scls, props)
 
         return schema
 
+    def _needs_field_propagation(
+        self,
+        scls: so.InheritingObject,
+        props: Tuple[str, ...],
+    ) -> bool:
+        # Descendants only need to be revisited if one of the altered
+        # fields is something they can inherit, or if this is a special
+        # field alter, which gets replayed on every descendant.
+        if isinstance(self, sd.AlterSpecialObjectField):
+            return True
+
+        return bool(set(scls.inheritable_fields()) & set(props))
+
     def _propagate_field_alter(
         self,
         schema: s_schema.Schema,
@@ -1076,7 +1121,17 @@ class RebaseInheritingObject(
         if not context.canonical:
             schema = self._recompute_inheritance(schema, context)
             if context.enable_recursion:
-                for descendant in self.scls.ordered_descendants(schema):
+                descendants = self.scls.ordered_descendants(schema)
+                # Recomputing inheritance of the descendants does not
+                # change anyone's bases, so compute all of the new
+                # lineages against the same schema, letting the
+                # descendants share the cached lineages of their common
+                # ancestors instead of recomputing them after every
+                # intermediate schema change.
+                new_ancestors = {
+                    d: so.compute_ancestors(schema, d) for d in descendants
+                }
+                for descendant in descendants:
                     d_root_cmd, d_alter_cmd, ctx_stack = (
                         descendant.init_delta_branch(
                             schema, context, sd.AlterObject))
@@ -1085,7 +1140,10 @@ class RebaseInheritingObject(
                         d_alter_cmd._fixup_inheritance_refdicts(
                             schema, context)
                         schema = d_alter_cmd._recompute_inheritance(
-                            schema, context)
+                            schema,
+                            context,
+                            ancestors=new_ancestors[descendant],
+                        )
                     self.add_caused(d_root_cmd)
 
         return schema
@@ -1125,15 +1183,14 @@ class RebaseInheritingObject(
             default_base = None
 
         removed_bases = {b.name for b in self.removed_bases}
-        existing_bases = set()
-
-        for b in bases:
-            if b.get_name(schema) in removed_bases:
-                bases.remove(b)
-            else:
-                existing_bases.add(b.get_name(schema))
+        kept = [
+            (b, name) for b in bases
+            if (name := b.get_name(schema)) not in removed_bases
+        ]
+        bases = [b for b, _ in kept]
+        existing_bases = {name for _, name in kept}
 
-        index = {b.get_name(schema): i for i, b in enumerate(bases)}
+        index = {name: i for i, (_, name) in enumerate(kept)}
 
         for new_bases, pos in self.added_bases:
             if isinstance(pos, tuple):
@@ -1146,12 +1203,29 @@ class RebaseInheritingObject(
             else:
                 idx = index[ref.name]
 
-            bases[idx:idx] = [
-                self.get_object(
-                    schema, context, name=b.name, sourcectx=b.sourcectx)
+            # The shells are resolved by name, so the shell name is
+            # the name of the resolved object; no need to ask the schema.
+            inserted = [
+                (
+                    b.name,
+                    self.get_object(
+                        schema, context, name=b.name, sourcectx=b.sourcectx),
+                )
                 for b in new_bases if b.name not in existing_bases
             ]
-            index = {b.get_name(schema): i for i, b in enumerate(bases)}
+            if not inserted:
+                continue
+
+            bases[idx:idx] = [obj for _, obj in inserted]
+
+            # Shift the positions of the bases following the insertion
+            # point instead of rebuilding the whole index.
+            shift = len(inserted)
+            for name, i in index.items():
+                if i >= idx:
+                    index[name] = i + shift
+            for i, (name, _) in enumerate(inserted, start=idx):
+                index[name] = i
 
         if not bases and default_base:
             bases = [default_base]
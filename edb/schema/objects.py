@@ -581,6 +581,9 @@ class ObjectMeta(type):
     _aux_cmd_data_fields: FrozenSet[SchemaField[Any]]  # if f.aux_cmd_data
     _refdicts: collections.OrderedDict[str, RefDict]
     _refdicts_by_refclass: Dict[type, RefDict]
+    #: Memoized get_refdict_for_class() results keyed on the
+    #: requested class, including subclasses of the refdict classes.
+    _refdicts_by_subclass: Dict[type, RefDict]
     _refdicts_by_field: Dict[str, RefDict]  # key is rd.attr
     _ql_class: Optional[qltypes.SchemaObjectClass]
     _reflection_method: ReflectionMethod
@@ -753,6 +756,7 @@ class ObjectMeta(type):
                 mcls._ql_map[qlkind] = cls
 
         cls._refdicts_by_refclass = {}
+        cls._refdicts_by_subclass = {}
 
         for dct in refdicts.values():
             if dct.attr not in cls._fields:
@@ -873,11 +877,19 @@ class ObjectMeta(type):
         return refdict
 
     def get_refdict_for_class(cls, refcls: type) -> RefDict:
+        try:
+            return cls._refdicts_by_subclass[refcls]
+        except KeyError:
+            pass
+
         for rcls in refcls.__mro__:
             try:
-                return cls._refdicts_by_refclass[rcls]
+                refdict = cls._refdicts_by_refclass[rcls]
             except KeyError:
                 pass
+            else:
+                cls._refdicts_by_subclass[refcls] = refdict
+                return refdict
         else:
             raise KeyError(f'{cls} has no refdict for {refcls}')
 
@@ -1444,6 +1456,15 @@ class Object(s_abc.Object, ObjectContainer, metaclass=ObjectMeta):
         collection: str,
         obj: Object,
         replace: bool = False,
+    ) -> s_schema.Schema:
+        return self.add_classrefs(schema, collection, [obj], replace=replace)
+
+    def add_classrefs(
+        self,
+        schema: s_schema.Schema,
+        collection: str,
+        objs: Iterable[Object],
+        replace: bool = False,
     ) -> s_schema.Schema:
         refdict = type(self).get_refdict(collection)
         attr = refdict.attr
@@ -1453,9 +1474,9 @@ class Object(s_abc.Object, ObjectContainer, metaclass=ObjectMeta):
         coll = self.get_explicit_field_value(schema, attr, None)
 
         if coll is not None:
-            schema, all_coll = coll.update(schema, [obj])
+            schema, all_coll = coll.update(schema, objs)
         else:
-            all_coll = colltype.create(schema, [obj])
+            all_coll = colltype.create(schema, objs)
 
         schema = self.set_field_value(schema, attr, all_coll)
 
@@ -2964,15 +2985,7 @@ class InheritingObject(SubclassableObject):
         schema: s_schema.Schema
     ) -> Optional[InheritingObjectT]:
         """Get the topmost non-abstract base."""
-        lineage = self.get_ancestors(schema).objects(schema)
-        for ancestor in reversed(lineage):
-            if not ancestor.get_abstract(schema):
-                return ancestor
-
-        if not self.get_abstract(schema):
-            return self
-
-        return None
+        return _get_topmost_concrete_base(schema, self)
 
     def get_topmost_concrete_base(
         self: InheritingObjectT,
@@ -3001,8 +3014,15 @@ class InheritingObject(SubclassableObject):
         if parent == self:
             return True
 
-        lineage = self.get_ancestors(schema).objects(schema)
-        return parent in lineage
+        return parent.id in self.get_ancestor_ids(schema)
+
+    @functools.lru_cache()
+    def get_ancestor_ids(
+        self,
+        schema: s_schema.Schema,
+    ) -> FrozenSet[uuid.UUID]:
+        """Return a set of ids of all ancestors of this object."""
+        return frozenset(self.get_ancestors(schema).ids(schema))
 
     def descendants(
         self: InheritingObjectT, schema: s_schema.Schema
@@ -3301,55 +3321,107 @@ def _serialize_to_markup(o: Object, *, ctx: markup.Context) -> markup.Markup:
 
 
 def _merge_lineage(
-    lineage: Iterable[List[InheritingObjectT]],
-    subject_name: str,
+    lineage: Iterable[Sequence[InheritingObjectT]],
+    subject_name: Callable[[], str],
 ) -> List[InheritingObjectT]:
-    result: List[Any] = []
+    # Map every distinct object to a dense integer index up front, so
+    # that the merge loop below only has to deal with ints, rather than
+    # hashing and comparing schema objects over and over.
+    objs: List[InheritingObjectT] = []
+    obj_index: Dict[InheritingObjectT, int] = {}
+    lines: List[List[int]] = []
+    for line in lineage:
+        if not line:
+            continue
+        idx_line = []
+        for obj in line:
+            idx = obj_index.get(obj)
+            if idx is None:
+                idx = obj_index[obj] = len(objs)
+                objs.append(obj)
+            idx_line.append(idx)
+        lines.append(idx_line)
+
+    # Number of times each object appears in a line in a non-head
+    # position.  A head is a valid candidate iff it appears in no tail.
+    tail_count = [0] * len(objs)
+    for idx_line in lines:
+        for idx in idx_line[1:]:
+            tail_count[idx] += 1
+
+    # Position of the current head of each line.
+    heads = [0] * len(lines)
+    nonempty = list(range(len(lines)))
+    result: List[InheritingObjectT] = []
 
     while True:
-        nonempty = [line for line in lineage if line]
+        nonempty = [n for n in nonempty if heads[n] < len(lines[n])]
         if not nonempty:
             return result
 
-        for line in nonempty:
-            candidate = line[0]
-            tails = [m for m in nonempty if candidate in m[1:]]
-            if not tails:
+        for n in nonempty:
+            candidate = lines[n][heads[n]]
+            if not tail_count[candidate]:
                 break
         else:
             raise errors.SchemaError(
-                f"Could not find consistent ancestor order for {subject_name}"
+                f"Could not find consistent ancestor order for "
+                f"{subject_name()}"
             )
 
-        result.append(candidate)
+        result.append(objs[candidate])
 
-        for line in nonempty:
-            if line[0] == candidate:
-                del line[0]
+        for n in nonempty:
+            idx_line = lines[n]
+            head = heads[n]
+            if idx_line[head] == candidate:
+                head += 1
+                heads[n] = head
+                if head < len(idx_line):
+                    # The next element moves from the tail to the head.
+                    tail_count[idx_line[head]] -= 1
 
 
+# Schemas are immutable, so the lineage of an object is fully determined
+# by the (schema, object) pair.  Caching it means that ancestor chains
+# shared between many descendants (e.g. when a rebase recomputes the
+# ancestors of a whole subtree) are only linearized once.
+@functools.lru_cache()
 def _compute_lineage(
     schema: s_schema.Schema,
     obj: InheritingObjectT,
-    subject_name: str,
-) -> List[InheritingObjectT]:
+) -> Tuple[InheritingObjectT, ...]:
     bases = tuple(obj.get_bases(schema).objects(schema))
-    lineage = [[obj]]
+    if not bases:
+        return (obj,)
+    elif len(bases) == 1:
+        # Single inheritance is by far the most common case, and
+        # the C3 merge of a single lineage is the lineage itself.
+        return (obj,) + _compute_lineage(schema, bases[0])
+
+    lineage: List[Sequence[InheritingObjectT]] = [(obj,)]
 
     for base in bases:
-        lineage.append(_compute_lineage(schema, base, subject_name))
+        lineage.append(_compute_lineage(schema, base))
 
-    return _merge_lineage(lineage, subject_name)
+    # The subject name is only needed for the error message, so
+    # avoid computing it unless the merge fails.
+    return tuple(
+        _merge_lineage(lineage, lambda: obj.get_verbosename(schema)))
 
 
 def compute_lineage(
     schema: s_schema.Schema,
     bases: Iterable[InheritingObjectT],
-    subject_name: str,
+    subject_name: Callable[[], str],
 ) -> List[InheritingObjectT]:
+    base_objs = tuple(bases)
+    if len(base_objs) == 1:
+        return list(_compute_lineage(schema, base_objs[0]))
+
     lineage = []
-    for base in bases:
-        lineage.append(_compute_lineage(schema, base, subject_name))
+    for base in base_objs:
+        lineage.append(_compute_lineage(schema, base))
 
     return _merge_lineage(lineage, subject_name)
 
@@ -3361,10 +3433,26 @@ def compute_ancestors(
     return compute_lineage(
         schema,
         obj.get_bases(schema).objects(schema),
-        obj.get_verbosename(schema),
+        lambda: obj.get_verbosename(schema),
     )
 
 
+@functools.lru_cache()
+def _get_topmost_concrete_base(
+    schema: s_schema.Schema,
+    obj: InheritingObjectT,
+) -> Optional[InheritingObjectT]:
+    lineage = obj.get_ancestors(schema).objects(schema)
+    for ancestor in reversed(lineage):
+        if not ancestor.get_abstract(schema):
+            return ancestor
+
+    if not obj.get_abstract(schema):
+        return obj
+
+    return None
+
+
 def derive_name(
     schema: s_schema.Schema,
     *qualifiers: str,
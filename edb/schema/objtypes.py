@@ -22,6 +22,8 @@ from __future__ import annotations
 from typing import *
 
 import collections
+import functools
+import operator
 
 from edb.edgeql import ast as qlast
 from edb.edgeql import qltypes
@@ -134,6 +136,9 @@ class ObjectType(
         return self.is_union_type(schema) or self.is_intersection_type(schema)
 
     def get_displayname(self, schema: s_schema.Schema) -> str:
+        return _get_displayname(schema, self)
+
+    def _compute_displayname(self, schema: s_schema.Schema) -> str:
         if self.is_view(schema) and not self.get_alias_is_persistent(schema):
             schema, mtype = self.material_type(schema)
         else:
@@ -145,13 +150,12 @@ class ObjectType(
                 std_obj = schema.get('std::BaseObject', type=ObjectType)
                 return std_obj.get_displayname(schema)
             else:
-                comps = sorted(union_of.objects(schema), key=lambda o: o.id)
+                comps = _sort_by_id(union_of.objects(schema))
                 return ' | '.join(c.get_displayname(schema) for c in comps)
         else:
             intersection_of = mtype.get_intersection_of(schema)
             if intersection_of:
-                comps = sorted(intersection_of.objects(schema),
-                               key=lambda o: o.id)
+                comps = _sort_by_id(intersection_of.objects(schema))
                 comp_dns = (c.get_displayname(schema) for c in comps)
                 # Elide BaseObject from display, because `& BaseObject`
                 # is a nop.
@@ -173,29 +177,29 @@ class ObjectType(
         if sn.is_qualified(name):
             raise ValueError(
                 'references to concrete pointers must not be qualified')
-        ptrs = {
-            lnk for lnk in schema.get_referrers(self, scls_type=links.Link,
-                                                field_name='target')
+
+        sources = frozenset(sources)
+
+        def _match(lnk: links.Link) -> bool:
             if (
-                lnk.get_shortname(schema).name == name
-                and not lnk.get_source_type(schema).is_view(schema)
-                and lnk.get_owned(schema)
-                and (not sources or lnk.get_source_type(schema) in sources)
-            )
-        }
-
-        for obj in self.get_ancestors(schema).objects(schema):
-            ptrs.update(
-                lnk for lnk in schema.get_referrers(obj, scls_type=links.Link,
-                                                    field_name='target')
-                if (
-                    lnk.get_shortname(schema).name == name
-                    and not lnk.get_source_type(schema).is_view(schema)
-                    and lnk.get_owned(schema)
-                    and (not sources or lnk.get_source_type(schema) in sources)
-                )
+                not lnk.get_owned(schema)
+                or lnk.get_shortname(schema).name != name
+            ):
+                return False
+            stype = lnk.get_source_type(schema)
+            return (
+                not stype.is_view(schema)
+                and (not sources or stype in sources)
             )
 
+        ptrs: Set[links.Link] = set()
+
+        # Links can target this type or any of its ancestors.
+        targets = (self,) + self.get_ancestors(schema).objects(schema)
+        for target in targets:
+            ptrs.update(filter(_match, schema.get_referrers(
+                target, scls_type=links.Link, field_name='target')))
+
         for intersection in self.get_intersection_of(schema).objects(schema):
             ptrs.update(intersection.getrptrs(schema, name, sources=sources))
 
@@ -251,53 +255,69 @@ class ObjectType(
         self,
         schema: s_schema.Schema,
         parent: so.SubclassableObject
+    ) -> bool:
+        return _issubclass(schema, self, parent)
+
+    def _compute_issubclass(
+        self,
+        schema: s_schema.Schema,
+        parent: so.SubclassableObject
     ) -> bool:
         if self == parent:
             return True
 
+        # Check the lineage before expanding compound types: it is
+        # cheap, and compound types only ever inherit from
+        # std::BaseObject, which all of their components extend too,
+        # so the answer is the same.
+        if parent.id in self.get_ancestor_ids(schema):
+            return True
+
+        # Object types only ever descend from other object types, so
+        # neither compound expansion below can succeed otherwise.
+        if not isinstance(parent, ObjectType):
+            return False
+
         my_union = self.get_union_of(schema)
         if my_union and not self.get_is_opaque_union(schema):
             # A union is considered a subclass of a type, if
             # ALL its components are subclasses of that type.
-            return all(
-                t._issubclass(schema, parent)
-                for t in my_union.objects(schema)
-            )
+            for t in my_union.objects(schema):
+                if not _issubclass(schema, t, parent):
+                    return False
+            return True
 
         my_intersection = self.get_intersection_of(schema)
         if my_intersection:
             # An intersection is considered a subclass of a type, if
             # ANY of its components are subclasses of that type.
-            return any(
-                t._issubclass(schema, parent)
-                for t in my_intersection.objects(schema)
-            )
-
-        lineage = self.get_ancestors(schema).objects(schema)
-        if parent in lineage:
-            return True
+            for t in my_intersection.objects(schema):
+                if _issubclass(schema, t, parent):
+                    return True
+            return False
 
-        elif isinstance(parent, ObjectType):
-            parent_union = parent.get_union_of(schema)
-            if parent_union:
-                # A type is considered a subclass of a union type,
-                # if it is a subclass of ANY of the union components.
-                return (
-                    parent.get_is_opaque_union(schema)
-                    or any(
-                        self._issubclass(schema, t)
-                        for t in parent_union.objects(schema)
-                    )
-                )
+        parent_union = parent.get_union_of(schema)
+        if parent_union:
+            # A type is considered a subclass of a union type,
+            # if it is a subclass of ANY of the union components.
+            if (
+                parent.get_is_opaque_union(schema)
+                or self.id in parent_union.ids(schema)
+            ):
+                return True
+            for t in parent_union.objects(schema):
+                if _issubclass(schema, self, t):
+                    return True
+            return False
 
-            parent_intersection = parent.get_intersection_of(schema)
-            if parent_intersection:
-                # A type is considered a subclass of an intersection type,
-                # if it is a subclass of ALL of the intersection components.
-                return all(
-                    self._issubclass(schema, t)
-                    for t in parent_intersection.objects(schema)
-                )
+        parent_intersection = parent.get_intersection_of(schema)
+        if parent_intersection:
+            # A type is considered a subclass of an intersection type,
+            # if it is a subclass of ALL of the intersection components.
+            for t in parent_intersection.objects(schema):
+                if not _issubclass(schema, self, t):
+                    return False
+            return True
 
         return False
 
@@ -331,26 +351,97 @@ class ObjectType(
             return None
 
 
-def get_or_create_union_type(
+# Subtype checks on object types are pervasive in the compiler, and
+# for compound types they recurse into every component.  The answer
+# only depends on the (immutable) schema and the two types, so it is
+# safe to memoize.
+@functools.lru_cache()
+def _issubclass(
+    schema: s_schema.Schema,
+    objtype: ObjectType,
+    parent: so.SubclassableObject,
+) -> bool:
+    return objtype._compute_issubclass(schema, parent)
+
+
+# Display names of object types may require resolving the material
+# type and the names of all compound type components, and are requested
+# a lot when formatting errors and type descriptions.
+@functools.lru_cache()
+def _get_displayname(
     schema: s_schema.Schema,
+    objtype: ObjectType,
+) -> str:
+    return objtype._compute_displayname(schema)
+
+
+def _sort_by_id(objs: Sequence[so.Object_T]) -> Sequence[so.Object_T]:
+    # Most compound types have just two components, which is
+    # cheaper to order directly than with a full sort.
+    if len(objs) <= 1:
+        return objs
+    elif len(objs) == 2:
+        a, b = objs
+        return objs if a.id < b.id else (b, a)
+    else:
+        return sorted(objs, key=operator.attrgetter('id'))
+
+
+def _canonicalize_components(
     components: Iterable[ObjectType],
-    *,
-    transient: bool = False,
-    opaque: bool = False,
-    module: Optional[str] = None,
-) -> Tuple[s_schema.Schema, ObjectType, bool]:
+) -> Tuple[ObjectType, ...]:
+    """Return *components* without duplicates and ordered by id.
+
+    Duplicates are merged on purpose: ``A | A`` and ``A & A`` denote
+    the same type as ``A``, so repeated components must not produce a
+    distinct compound type.
+    """
+    return tuple(_sort_by_id(tuple(dict.fromkeys(components))))
+
 
+@functools.lru_cache()
+def _lookup_union_type(
+    schema: s_schema.Schema,
+    components: Tuple[ObjectType, ...],
+    opaque: bool,
+    module: Optional[str],
+) -> Tuple[sn.QualName, Optional[ObjectType]]:
     name = s_types.get_union_type_name(
         (c.get_name(schema) for c in components),
         opaque=opaque,
         module=module,
     )
+    return name, schema.get(name, default=None, type=ObjectType)
+
+
+@functools.lru_cache()
+def _lookup_intersection_type(
+    schema: s_schema.Schema,
+    components: Tuple[ObjectType, ...],
+    module: Optional[str],
+) -> Tuple[sn.QualName, Optional[ObjectType]]:
+    name = s_types.get_intersection_type_name(
+        (c.get_name(schema) for c in components),
+        module=module,
+    )
+    return name, schema.get(name, default=None, type=ObjectType)
 
-    objtype = schema.get(name, default=None, type=ObjectType)
+
+def get_or_create_union_type(
+    schema: s_schema.Schema,
+    components: Iterable[ObjectType],
+    *,
+    transient: bool = False,
+    opaque: bool = False,
+    module: Optional[str] = None,
+) -> Tuple[s_schema.Schema, ObjectType, bool]:
+
+    # Compound type names do not depend on component order, so
+    # canonicalize the components to make the lookup key stable.
+    components = _canonicalize_components(components)
+    name, objtype = _lookup_union_type(schema, components, opaque, module)
     created = objtype is None
     if objtype is None:
-        components = list(components)
-
         std_object = schema.get('std::BaseObject', type=ObjectType)
 
         schema, objtype = std_object.derive_subtype(
@@ -368,7 +459,7 @@ def get_or_create_union_type(
 
             schema = sources.populate_pointer_set_for_source_union(
                 schema,
-                cast(List[sources.Source], components),
+                cast(List[sources.Source], list(components)),
                 objtype,
                 modname=module,
             )
@@ -384,16 +475,10 @@ def get_or_create_intersection_type(
     transient: bool = False,
 ) -> Tuple[s_schema.Schema, ObjectType, bool]:
 
-    name = s_types.get_intersection_type_name(
-        (c.get_name(schema) for c in components),
-        module=module,
-    )
-
-    objtype = schema.get(name, default=None, type=ObjectType)
+    components = _canonicalize_components(components)
+    name, objtype = _lookup_intersection_type(schema, components, module)
     created = objtype is None
     if objtype is None:
-        components = list(components)
-
         std_object = schema.get('std::BaseObject', type=ObjectType)
 
         schema, objtype = std_object.derive_subtype(
@@ -429,9 +514,15 @@ def get_or_create_intersection_type(
 
             intersection_pointers[pn] = ptr
 
-        for pn, ptr in intersection_pointers.items():
-            if objtype.maybe_get_ptr(schema, pn) is None:
-                schema = objtype.add_pointer(schema, ptr)
+        # Add all of the missing pointers at once, rather than
+        # rebuilding the pointer collection once per pointer.
+        existing = set(objtype.get_pointers(schema).keys(schema))
+        new_ptrs = [
+            ptr for pn, ptr in intersection_pointers.items()
+            if pn not in existing
+        ]
+        if new_ptrs:
+            schema = objtype.add_pointers(schema, new_ptrs)
 
     assert isinstance(objtype, ObjectType)
     return schema, objtype, created
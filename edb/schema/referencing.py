@@ -1131,6 +1131,11 @@ class CreateReferencedInheritingObject(
         assert issubclass(ref_rebase_cmd, RebaseReferencedInheritingObject)
         refdict = referrer_cls.get_refdict_for_class(mcls)
         parent_fq_refname = self.scls.get_name(schema)
+        # This is needed to get the correct inherited name which will
+        # either be created or rebased.
+        ref_field_type = referrer_cls.get_field(refdict.attr).type
+        refname = ref_field_type.get_key_for_name(schema, parent_fq_refname)
+        specials = list(self.get_subcommands(type=sd.AlterSpecialObjectField))
 
         for child in referrer.children(schema):
             if not child.allow_ref_propagation(schema, context, refdict):
@@ -1140,12 +1145,6 @@ class CreateReferencedInheritingObject(
                 schema, context, sd.AlterObject)
 
             with ctx_stack():
-                # This is needed to get the correct inherited name which will
-                # either be created or rebased.
-                ref_field_type = type(child).get_field(refdict.attr).type
-                refname = ref_field_type.get_key_for_name(
-                    schema, parent_fq_refname)
-
                 astnode = ref_create_cmd.as_inherited_ref_ast(
                     schema, context, refname, self.scls)
                 fq_name = self._classname_from_ast(schema, astnode, context)
@@ -1166,8 +1165,7 @@ class CreateReferencedInheritingObject(
                 ref_create.if_not_exists = True
 
                 # Copy any special updates over
-                for special in self.get_subcommands(
-                        type=sd.AlterSpecialObjectField):
+                for special in specials:
                     ref_create.add(special.clone(ref_create.classname))
 
                 ref_create.set_attribute_value(refdict.backref_attr, child)
@@ -1431,14 +1429,15 @@ class DeleteReferencedInheritingObject(
         referrer_class = type(referrer)
         mcls = type(scls)
         refdict = referrer_class.get_refdict_for_class(mcls)
-        reftype = referrer_class.get_field(refdict.attr).type
+        refattr = refdict.attr
+        reftype = referrer_class.get_field(refattr).type
 
         if (
             not context.in_deletion(offset=1)
             and not context.disable_dep_verification
         ):
             implicit_bases = set(self._get_implicit_ref_bases(
-                schema, context, referrer, refdict.attr, self_name))
+                schema, context, referrer, refattr, self_name))
 
             if implicit_bases:
                 # Cannot remove inherited objects.
@@ -1467,7 +1466,7 @@ class DeleteReferencedInheritingObject(
             sd.sort_by_inheritance(schema, referrer.children(schema))
         ):
             assert isinstance(child, so.QualifiedObject)
-            child_coll = child.get_field_value(schema, refdict.attr)
+            child_coll = child.get_field_value(schema, refattr)
             fq_refname_in_child = self._classname_from_name(
                 self_name,
                 child.get_name(schema),
@@ -149,6 +149,17 @@ class Source(so.QualifiedObject, indexes.IndexableSubject):
             schema, 'pointers', pointer, replace=replace)
         return schema
 
+    def add_pointers(
+        self,
+        schema: s_schema.Schema,
+        pointers: Iterable[s_pointers.Pointer],
+        *,
+        replace: bool = False
+    ) -> s_schema.Schema:
+        schema = self.add_classrefs(
+            schema, 'pointers', pointers, replace=replace)
+        return schema
+
 
 def populate_pointer_set_for_source_union(
     schema: s_schema.Schema,
@@ -691,16 +691,17 @@ def minimize_class_set_by_most_generic(
     """Minimize the given set of objects by filtering out all subclasses."""
 
     classes = list(classes)
-    mros = [set(p.get_ancestors(schema).objects(schema)) for p in classes]
+    if len(classes) <= 1:
+        return classes
+
+    mros = [p.get_ancestor_ids(schema) for p in classes]
+    ids = [p.id for p in classes]
     count = len(classes)
-    smap = itertools.starmap
 
     # Return only those entries that do not have other entries in their mro
     result = [
         scls for i, scls in enumerate(classes)
-        if not any(smap(set.__contains__,
-                        ((mros[i], classes[j])
-                         for j in range(count) if j != i)))
+        if not any(ids[j] in mros[i] for j in range(count) if j != i)
     ]
 
     return result
@@ -713,17 +714,20 @@ def minimize_class_set_by_least_generic(
     """Minimize the given set of objects by filtering out all superclasses."""
 
     classes = list(classes)
-    mros = [set(p.get_ancestors(schema).objects(schema)) | {p}
-            for p in classes]
+    if len(classes) <= 1:
+        return classes
+
+    mros = [p.get_ancestor_ids(schema) for p in classes]
+    ids = [p.id for p in classes]
     count = len(classes)
-    smap = itertools.starmap
 
     # Return only those entries that are not present in other entries' mro
     result = [
         scls for i, scls in enumerate(classes)
-        if not any(smap(set.__contains__,
-                        ((mros[j], classes[i])
-                         for j in range(count) if j != i)))
+        if not any(
+            ids[i] == ids[j] or ids[i] in mros[j]
+            for j in range(count) if j != i
+        )
     ]
 
     return result
@@ -1615,6 +1615,157 @@ class TestSchema(tb.BaseSchemaLoadTest):
             )
         )
 
+    def test_schema_compound_type_component_order(self):
+        schema = self.load_schema("""
+            type A;
+            type B;
+        """)
+
+        A = schema.get('test::A')
+        B = schema.get('test::B')
+        # Pass the components out of id order first, so that the
+        # created type has to be canonicalized.
+        if A.id < B.id:
+            A, B = B, A
+
+        self.assertEqual(
+            s_objtypes._canonicalize_components([A, B, A]),
+            (B, A),
+        )
+
+        schema, union1, created = s_objtypes.get_or_create_union_type(
+            schema, [A, B])
+        self.assertTrue(created)
+        schema, union2, created = s_objtypes.get_or_create_union_type(
+            schema, [B, A])
+        self.assertFalse(created)
+        self.assertEqual(union1, union2)
+        # Repeated components are merged into the same type.
+        schema, union3, created = s_objtypes.get_or_create_union_type(
+            schema, [B, A, B])
+        self.assertFalse(created)
+        self.assertEqual(union1, union3)
+        # union_of/intersection_of are ObjectSets, which do not keep
+        # order, so check that the duplicate was merged away.
+        self.assertEqual(
+            sorted(union1.get_union_of(schema).ids(schema)),
+            sorted((A.id, B.id)),
+        )
+
+        schema, isect1, created = s_objtypes.get_or_create_intersection_type(
+            schema, [A, B])
+        self.assertTrue(created)
+        schema, isect2, created = s_objtypes.get_or_create_intersection_type(
+            schema, [B, A])
+        self.assertFalse(created)
+        self.assertEqual(isect1, isect2)
+        schema, isect3, created = s_objtypes.get_or_create_intersection_type(
+            schema, [B, A, B])
+        self.assertFalse(created)
+        self.assertEqual(isect1, isect3)
+        # union_of/intersection_of are ObjectSets, which do not keep
+        # order, so check that the duplicate was merged away.
+        self.assertEqual(
+            sorted(isect1.get_intersection_of(schema).ids(schema)),
+            sorted((A.id, B.id)),
+        )
+
+    def test_schema_drop_adjacent_bases(self):
+        schema = self.load_schema("""
+            type A;
+            type B;
+            type D;
+            type C extending A, B, D;
+        """)
+
+        Object = schema.get('std::Object')
+        BaseObject = schema.get('std::BaseObject')
+        D = schema.get('test::D')
+        C = schema.get('test::C')
+
+        schema = self.run_ddl(schema, """
+            ALTER TYPE test::C DROP EXTENDING test::A, test::B;
+        """)
+
+        self.assertEqual(C.get_bases(schema).objects(schema), (D,))
+        self.assertEqual(
+            C.get_ancestors(schema).objects(schema),
+            (D, Object, BaseObject),
+        )
+
+    def test_schema_drop_adjacent_bases_migration(self):
+        schema = self.load_schema("""
+            type A;
+            type B;
+            type D;
+            type C extending A, B, D;
+        """)
+
+        Object = schema.get('std::Object')
+        BaseObject = schema.get('std::BaseObject')
+        D = schema.get('test::D')
+        C = schema.get('test::C')
+
+        schema = self.run_ddl(schema, """
+            START MIGRATION TO {
+                module test {
+                    type A;
+                    type B;
+                    type D;
+                    type C extending D;
+                }
+            };
+            POPULATE MIGRATION;
+            COMMIT MIGRATION;
+        """)
+
+        self.assertEqual(C.get_bases(schema).objects(schema), (D,))
+        self.assertEqual(
+            C.get_ancestors(schema).objects(schema),
+            (D, Object, BaseObject),
+        )
+
+    def test_schema_alter_inheritable_field_propagation(self):
+        schema = self.load_schema("""
+            type A {
+                property name -> str;
+            }
+            type B extending A;
+            type C extending B;
+        """)
+
+        A = schema.get('test::A')
+        B = schema.get('test::B')
+        C = schema.get('test::C')
+
+        schema = self.run_ddl(schema, """
+            ALTER TYPE test::A {
+                ALTER PROPERTY name {
+                    SET default := 'foo';
+                };
+            };
+        """)
+
+        # An alter of an inheritable field must reach all descendants.
+        for obj in (A, B, C):
+            name = obj.getptr(schema, s_name.UnqualName('name'))
+            self.assertEqual(name.get_default(schema).text, "'foo'")
+
+        schema = self.run_ddl(schema, """
+            ALTER TYPE test::A SET ABSTRACT;
+        """)
+
+        # A non-inheritable field only changes on the object itself.
+        self.assertTrue(A.get_abstract(schema))
+        self.assertFalse(B.get_abstract(schema))
+        self.assertFalse(C.get_abstract(schema))
+        self.assertEqual(
+            C.get_ancestors(schema).objects(schema)[:2],
+            (B, A),
+        )
+        name = C.getptr(schema, s_name.UnqualName('name'))
+        self.assertEqual(name.get_default(schema).text, "'foo'")
+
     def test_schema_ast_contects_01(self):
         schema = self.load_schema("")
         schema = self.run_ddl(schema, """